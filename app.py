@@ -3,13 +3,17 @@
 import streamlit as st
 import logging
 import os
-import zipfile
-import io
 
 from utils.file_processing import extract_text_from_pdf, extract_text_from_docx, process_pdf
 from utils.openai_client import initialize_openai_client
 from utils.question_generation import generate_questions_for_content
+from utils.prompt_registry import preload_prompts
+from utils.archive import QuestionArchive
 from components.sidebar_content import render_sidebar
+from components.file_preview import render_file_preview, describe_upload, file_digests
+from components.job_plan import render_job_plan
+from utils.job_planner import plan_job
+from utils.warmup import start_warmup
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -49,8 +53,13 @@ MESSAGE_TYPES = [
     "inline_fib"
 ]
 
-def generate_all_questions(uploaded_files, general_user_input, general_learning_goals, selected_types, selected_language, selected_model, client):
-    """Generates questions for all uploaded files and returns a ZIP file."""
+# Load and validate all prompt templates once; unchanged files are served from the registry afterwards
+failed_prompts = preload_prompts(MESSAGE_TYPES)
+if failed_prompts:
+    st.warning(f"Folgende Prompt-Dateien fehlen oder sind ungültig: {', '.join(failed_prompts)}. Diese Fragetypen können nicht generiert werden.")
+
+def generate_all_questions(uploaded_files, general_user_input, general_learning_goals, selected_types, selected_language, selected_model, client, max_pages=None):
+    """Generates questions for all uploaded files and returns (data, file_name, mime) for download."""
     if not client:
         st.error("Bitte geben Sie Ihren OpenAI-API-Schlüssel ein, um Fragen zu generieren.")
         return None
@@ -59,15 +68,15 @@ def generate_all_questions(uploaded_files, general_user_input, general_learning_
         st.error("Bitte wählen Sie mindestens einen Fragetyp aus.")
         return None
 
-    # Create an in-memory ZIP file
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w") as zip_file:
+    # Single files are served as plain text, batches as a compressed ZIP
+    archive = QuestionArchive(single_file=len(uploaded_files) == 1)
+    try:
         for uploaded_file in uploaded_files:
             filename = uploaded_file.name
             st.info(f"Generiere Fragen für '{filename}'...")
             
             if uploaded_file.type == "application/pdf":
-                text_content, images = process_pdf(uploaded_file)
+                text_content, images = process_pdf(uploaded_file, max_pages)
                 if text_content:
                     # Generate questions based on extracted text
                     questions_text = generate_questions_for_content(
@@ -127,13 +136,15 @@ def generate_all_questions(uploaded_files, general_user_input, general_learning_
                 st.error(f"Nicht unterstützter Dateityp für '{filename}'.")
                 continue
 
-            # Save the generated questions as a text file in the ZIP
+            # Write the generated questions to the archive as soon as the file is done
             txt_filename = f"{os.path.splitext(filename)[0]}_olat.txt"
-            zip_file.writestr(txt_filename, questions_text)
+            archive.add(txt_filename, questions_text)
             st.success(f"Fragen für '{filename}' generiert und hinzugefügt.")
+    except Exception:
+        archive.discard()
+        raise
 
-    zip_buffer.seek(0)
-    return zip_buffer
+    return archive.finish()
 
 def main():
     """Main function for the Streamlit app."""
@@ -197,62 +208,59 @@ def main():
 
     if uploaded_files:
         st.markdown("### 📂 Hochgeladene Dateien")
+        digests = file_digests(uploaded_files)
         for idx, uploaded_file in enumerate(uploaded_files):
             file_idx = idx + 1
             with st.expander(f"📄 Datei {file_idx}: {uploaded_file.name}"):
-                if uploaded_file.type == "application/pdf":
-                    text_content, images = process_pdf(uploaded_file)
-                    if text_content:
-                        st.text_area("Extrahierter Text:", value=text_content, height=200, disabled=True)
-                    elif images:
-                        for img_idx, image in enumerate(images):
-                            st.image(image, caption=f'Seite {img_idx+1}', use_column_width=True)
-                elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    text_content = extract_text_from_docx(uploaded_file)
-                    st.text_area("Extrahierter Text:", value=text_content, height=200, disabled=True)
-                elif uploaded_file.type.startswith('image/'):
-                    from PIL import Image
-                    image_content = Image.open(uploaded_file)
-                    st.image(image_content, caption=f'Hochgeladenes Bild {file_idx}: {uploaded_file.name}', use_column_width=True)
-                else:
-                    st.error(f"Nicht unterstützter Dateityp für '{uploaded_file.name}'. Bitte laden Sie eine PDF, DOCX oder Bilddatei hoch.")
+                render_file_preview(uploaded_file, file_idx, digests[idx])
+
+        # Project the job before any API call is made
+        st.markdown("---")
+        st.markdown("### 🧮 Geschätzter Aufwand")
+        max_pages = st.number_input(
+            "Maximale Seiten pro gescanntem PDF (0 = alle Seiten):",
+            min_value=0,
+            value=0,
+            step=1
+        )
+        plan = plan_job(
+            [describe_upload(uploaded_file, digest) for uploaded_file, digest in zip(uploaded_files, digests)],
+            selected_types,
+            general_user_input,
+            general_learning_goals,
+            selected_model,
+            max_pages=max_pages or None
+        )
+        render_job_plan(plan)
 
         # Button to generate questions for all files
         st.markdown("---")
         if st.button("📥 Fragen generieren für alle Dateien"):
             with st.spinner("Generiere Fragen..."):
-                zip_buffer = generate_all_questions(
+                download = generate_all_questions(
                     uploaded_files, 
                     general_user_input, 
                     general_learning_goals, 
                     selected_types, 
                     selected_language, 
                     selected_model,
-                    client
+                    client,
+                    max_pages=max_pages or None
                 )
-                if zip_buffer:
-                    if len(uploaded_files) > 1:
-                        st.success("Fragen erfolgreich generiert!")
-                        st.download_button(
-                            label="🗜️ Generierte Fragen als ZIP herunterladen",
-                            data=zip_buffer,
-                            file_name="generierte_fragen.zip",
-                            mime="application/zip"
-                        )
-                    else:
-                        # Single file: Download the individual text file
-                        with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
-                            for file in zip_ref.namelist():
-                                extracted_file = zip_ref.read(file)
-                                st.success("Fragen erfolgreich generiert!")
-                                st.download_button(
-                                    label="📝 Generierte Fragen herunterladen",
-                                    data=extracted_file,
-                                    file_name=file,
-                                    mime="text/plain"
-                                )
+                if download:
+                    data, file_name, mime = download
+                    st.success("Fragen erfolgreich generiert!")
+                    st.download_button(
+                        label="🗜️ Generierte Fragen als ZIP herunterladen" if mime == "application/zip" else "📝 Generierte Fragen herunterladen",
+                        data=data,
+                        file_name=file_name,
+                        mime=mime
+                    )
     else:
         st.info("Bitte laden Sie eine oder mehrere PDF, DOCX oder Bilddateien hoch, um mit der Generierung von Fragen zu beginnen.")
 
+    # The page has been rendered; load the heavy dependencies in the background
+    start_warmup()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,134 @@
+# components/file_preview.py
+
+import hashlib
+import io
+import streamlit as st
+from utils.file_processing import (
+    extract_pdf_preview,
+    extract_text_from_docx,
+    convert_pdf_to_thumbnails,
+    image_to_jpeg,
+    open_image,
+    image_payload_chars,
+    pdf_page_payload_chars,
+)
+
+# Limits for the upload preview; question generation always uses the full file
+PREVIEW_TEXT_CHARS = 3000
+THUMBNAIL_WIDTH = 300
+THUMBNAIL_DPI = 50
+PAGES_PER_BLOCK = 4
+
+# Bound for each server-side preview cache, shared by all sessions
+PREVIEW_CACHE_ENTRIES = 64
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+def file_digests(uploaded_files):
+    """Returns a content hash per upload, computed once per file_id and kept in the session.
+
+    Entries of files that are no longer uploaded are dropped, so the session map stays bounded.
+    """
+    previous = st.session_state.get("file_digests", {})
+    digests = {}
+    for uploaded_file in uploaded_files:
+        file_id = uploaded_file.file_id
+        digests[file_id] = previous.get(file_id) or hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+    st.session_state["file_digests"] = digests
+    return [digests[uploaded_file.file_id] for uploaded_file in uploaded_files]
+
+@st.cache_data(show_spinner=False, max_entries=PREVIEW_CACHE_ENTRIES)
+def pdf_preview_info(digest, _data):
+    """Returns (page_count, text_preview) for a PDF."""
+    return extract_pdf_preview(io.BytesIO(_data), PREVIEW_TEXT_CHARS)
+
+@st.cache_data(show_spinner=False, max_entries=PREVIEW_CACHE_ENTRIES)
+def pdf_thumbnails(digest, first_page, last_page, _data):
+    """Renders a block of PDF pages as small JPEG thumbnails."""
+    return convert_pdf_to_thumbnails(_data, first_page, last_page, THUMBNAIL_WIDTH, THUMBNAIL_DPI)
+
+@st.cache_data(show_spinner=False, max_entries=PREVIEW_CACHE_ENTRIES)
+def docx_text_preview(digest, _data):
+    """Returns the capped text preview of a DOCX file."""
+    return extract_text_from_docx(io.BytesIO(_data), PREVIEW_TEXT_CHARS)
+
+@st.cache_data(show_spinner=False, max_entries=PREVIEW_CACHE_ENTRIES)
+def image_thumbnail(digest, _data):
+    """Returns a small JPEG thumbnail of an uploaded image."""
+    try:
+        return image_to_jpeg(open_image(io.BytesIO(_data)), THUMBNAIL_WIDTH)
+    except Exception as e:
+        st.error(f"Fehler bei der Verarbeitung des Bildes: {e}")
+        return None
+
+@st.cache_data(show_spinner=False, max_entries=PREVIEW_CACHE_ENTRIES)
+def image_payload_info(digest, is_pdf, _data):
+    """Returns the base64 payload length of an image, or of the first page of a scanned PDF."""
+    if is_pdf:
+        return pdf_page_payload_chars(_data)
+    try:
+        return image_payload_chars(io.BytesIO(_data))
+    except Exception as e:
+        st.error(f"Fehler bei der Verarbeitung des Bildes: {e}")
+        return 0
+
+def render_page_thumbnails(uploaded_file, file_idx, digest, page_count):
+    """Shows PDF page thumbnails on demand, PAGES_PER_BLOCK pages at a time."""
+    if not st.checkbox("Seitenvorschau anzeigen", key=f"preview_pages_{file_idx}_{digest}"):
+        return
+
+    block_count = (page_count + PAGES_PER_BLOCK - 1) // PAGES_PER_BLOCK
+    block = 1
+    if block_count > 1:
+        block = st.number_input(
+            f"Seitenblock (je {PAGES_PER_BLOCK} Seiten):",
+            min_value=1,
+            max_value=block_count,
+            value=1,
+            key=f"preview_block_{file_idx}_{digest}"
+        )
+    first_page = (block - 1) * PAGES_PER_BLOCK + 1
+    last_page = min(first_page + PAGES_PER_BLOCK - 1, page_count)
+
+    thumbnails = pdf_thumbnails(digest, first_page, last_page, uploaded_file.getvalue())
+    if thumbnails:
+        columns = st.columns(len(thumbnails))
+        for offset, (column, thumbnail) in enumerate(zip(columns, thumbnails)):
+            column.image(thumbnail, caption=f'Seite {first_page + offset} von {page_count}')
+
+def render_file_preview(uploaded_file, file_idx, digest):
+    """Renders a lightweight, cached preview of an uploaded file."""
+    if uploaded_file.type == "application/pdf":
+        page_count, text_preview = pdf_preview_info(digest, uploaded_file.getvalue())
+        if text_preview:
+            st.text_area("Extrahierter Text (Vorschau):", value=text_preview, height=200, disabled=True, key=f"preview_text_{file_idx}_{digest}")
+        elif page_count:
+            st.warning("Dieses PDF ist nicht OCR-geschützt. Die Seiten werden als Bilder verarbeitet.")
+            render_page_thumbnails(uploaded_file, file_idx, digest, page_count)
+    elif uploaded_file.type == DOCX_TYPE:
+        text_preview = docx_text_preview(digest, uploaded_file.getvalue())
+        st.text_area("Extrahierter Text (Vorschau):", value=text_preview, height=200, disabled=True, key=f"preview_text_{file_idx}_{digest}")
+    elif uploaded_file.type.startswith('image/'):
+        thumbnail = image_thumbnail(digest, uploaded_file.getvalue())
+        if thumbnail:
+            st.image(thumbnail, caption=f'Hochgeladenes Bild {file_idx}: {uploaded_file.name}')
+    else:
+        st.error(f"Nicht unterstützter Dateityp für '{uploaded_file.name}'. Bitte laden Sie eine PDF, DOCX oder Bilddatei hoch.")
+
+def describe_upload(uploaded_file, digest):
+    """Returns the cached planning info of an upload.
+
+    Keys: name, kind ('text', 'pages', 'image' or 'unsupported'), page count and
+    image_chars, the base64 payload length per page sent for image-based uploads.
+    """
+    info = {"name": uploaded_file.name, "kind": "unsupported", "pages": 0, "image_chars": 0}
+    if uploaded_file.type == "application/pdf":
+        page_count, text_preview = pdf_preview_info(digest, uploaded_file.getvalue())
+        info.update(kind="text" if text_preview else "pages", pages=page_count)
+        if not text_preview and page_count:
+            info["image_chars"] = image_payload_info(digest, True, uploaded_file.getvalue())
+    elif uploaded_file.type == DOCX_TYPE:
+        info.update(kind="text", pages=1)
+    elif uploaded_file.type.startswith('image/'):
+        info.update(kind="image", pages=1, image_chars=image_payload_info(digest, False, uploaded_file.getvalue()))
+    return info
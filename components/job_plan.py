@@ -0,0 +1,34 @@
+# components/job_plan.py
+
+import streamlit as st
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes} min {seconds:02d} s" if minutes else f"{seconds} s"
+
+def render_job_plan(plan):
+    """Shows the projected calls, tokens, cost and duration of a generation job."""
+    col_calls, col_tokens, col_cost, col_time = st.columns(4)
+    col_calls.metric("API-Aufrufe", plan["calls"])
+    col_tokens.metric("Tokens (Ein/Aus)", f"{plan['input_tokens']:,} / {plan['output_tokens']:,}".replace(",", "'"))
+    col_cost.metric("Geschätzte Kosten", f"{plan['cost']:.2f} $", help=f"Höchstens ca. {plan['max_cost']:.2f} $, wenn jede Antwort die maximale Länge erreicht.")
+    col_time.metric("Geschätzte Dauer", _format_duration(plan["seconds"]))
+
+    if plan["units"]:
+        with st.expander("Aufrufe im Detail"):
+            st.dataframe(
+                [
+                    {
+                        "Datei": unit["file"],
+                        "Seite": unit["page"],
+                        "Fragetyp": unit["type"],
+                        "Eingabe-Tokens": unit["input_tokens"],
+                        "Ausgabe-Tokens": unit["output_tokens"],
+                    }
+                    for unit in plan["units"]
+                ],
+                use_container_width=True
+            )
+    if plan["skipped_types"]:
+        st.caption(f"Nicht eingerechnet, da die Prompt-Datei fehlt oder ungültig ist: {', '.join(plan['skipped_types'])}.")
+    st.caption("Schätzung ohne API-Aufruf, basierend auf einer lokalen Token-Heuristik. Die tatsächlichen Werte können abweichen.")
@@ -33,8 +33,8 @@ def render_sidebar():
     <div class="custom-info">
         <strong>ℹ️ Kosteninformationen:</strong>
         <ul>
-            <li>Die Nutzungskosten hängen von der <strong>Länge der Eingabe</strong> ab (zwischen 0,01 $ und 0,1 $).</li>
-            <li>Jeder ausgewählte Fragetyp kostet ungefähr 0,01 $.</li>
+            <li>Die Nutzungskosten hängen von der <strong>Länge der Eingabe</strong>, dem Modell, den Fragetypen und bei gescannten PDFs und Bildern von der Anzahl Seiten ab.</li>
+            <li>Nach dem Hochladen zeigt die App unter <strong>Geschätzter Aufwand</strong> die erwarteten Aufrufe, Kosten und Dauer, bevor Sie die Fragen generieren.</li>
         </ul>
     </div>
     ''', unsafe_allow_html=True)
@@ -0,0 +1,53 @@
+# utils/archive.py
+
+import io
+import zipfile
+
+class QuestionArchive:
+    """Collects generated question files as they complete.
+
+    With a single file the text is served directly; otherwise entries are compressed
+    into a deflate ZIP as soon as they are added. st.download_button materializes its
+    data in memory, so a session still holds the whole compressed archive once; there is
+    no benefit in spooling it to disk first.
+    """
+
+    def __init__(self, single_file=False):
+        self.single_file = single_file
+        self.entries = 0
+        self._single_entry = None
+        self._buffer = None
+        self._zip_file = None
+        if not single_file:
+            self._buffer = io.BytesIO()
+            self._zip_file = zipfile.ZipFile(self._buffer, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def add(self, filename, text):
+        """Adds a finished question file; ZIP entries are compressed and written immediately."""
+        if self.single_file:
+            self._single_entry = (filename, text.encode("utf-8"))
+        else:
+            self._zip_file.writestr(filename, text)
+        self.entries += 1
+
+    def discard(self):
+        """Releases the archive without producing a download, e.g. after a failed generation."""
+        self._single_entry = None
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._buffer.close()
+
+    def finish(self):
+        """Closes the archive and returns (data, file_name, mime), or None if nothing was added."""
+        if self.single_file:
+            if self._single_entry is None:
+                return None
+            filename, data = self._single_entry
+            return data, filename, "text/plain"
+
+        self._zip_file.close()
+        if not self.entries:
+            self._buffer.close()
+            return None
+        self._buffer.seek(0)
+        return self._buffer, "generierte_fragen.zip", "application/zip"
@@ -1,76 +1,139 @@
 # utils/file_processing.py
 
-import PyPDF2
-import docx
-from pdf2image import convert_from_bytes
+# PyPDF2, docx, pdf2image and PIL are imported at first use to keep the app's startup light
 import io
-from PIL import Image
 import base64
+import math
 import re
 import streamlit as st
 
-def convert_pdf_to_images(file):
-    """Converts PDF pages to images."""
+# Longest image side sent to the model
+MAX_IMAGE_SIZE = 1000
+
+def _cap_text(text, max_chars):
+    """Shortens text to max_chars, marking the cut with an ellipsis."""
+    if max_chars is not None and len(text) > max_chars:
+        return text[:max_chars].rstrip() + " …"
+    return text
+
+def convert_pdf_to_images(file, max_pages=None):
+    """Converts PDF pages to images, optionally only the first max_pages pages."""
+    from pdf2image import convert_from_bytes
     try:
-        images = convert_from_bytes(file.read())
+        images = convert_from_bytes(file.read(), last_page=max_pages)
         return images
     except Exception as e:
         st.error(f"Fehler beim Konvertieren der PDF in Bilder: {e}")
         return []
 
-def extract_text_from_pdf(file):
-    """Extracts text from a PDF using PyPDF2."""
+def convert_pdf_to_thumbnails(data, first_page, last_page, width, dpi):
+    """Renders a range of PDF pages at low resolution and returns them as JPEG bytes."""
+    from pdf2image import convert_from_bytes
+    try:
+        images = convert_from_bytes(data, dpi=dpi, first_page=first_page, last_page=last_page, size=(width, None))
+        return [image_to_jpeg(image, width) for image in images]
+    except Exception as e:
+        st.error(f"Fehler beim Konvertieren der PDF in Bilder: {e}")
+        return []
+
+def _read_pdf_text(pdf_reader, max_chars=None):
+    text = ""
+    for page in pdf_reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text
+        if max_chars is not None and len(text) > max_chars:
+            break
+    return _cap_text(text.strip(), max_chars)
+
+def extract_text_from_pdf(file, max_chars=None):
+    """Extracts text from a PDF using PyPDF2, stopping once max_chars is reached."""
+    import PyPDF2
     try:
         pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text
-        return text.strip()
+        return _read_pdf_text(pdf_reader, max_chars)
     except Exception as e:
         st.error(f"Fehler beim Extrahieren des Textes aus der PDF: {e}")
         return ""
 
-def extract_text_from_docx(file):
-    """Extracts text from a DOCX file."""
+def extract_pdf_preview(file, max_chars):
+    """Returns (page_count, capped_text) of a PDF from a single parse."""
+    import PyPDF2
+    try:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return len(pdf_reader.pages), _read_pdf_text(pdf_reader, max_chars)
+    except Exception as e:
+        st.error(f"Fehler beim Extrahieren des Textes aus der PDF: {e}")
+        return 0, ""
+
+def extract_text_from_docx(file, max_chars=None):
+    """Extracts text from a DOCX file, stopping once max_chars is reached."""
+    import docx
     try:
         doc = docx.Document(file)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text.strip()
+        paragraphs = []
+        length = 0
+        for paragraph in doc.paragraphs:
+            paragraphs.append(paragraph.text)
+            length += len(paragraph.text) + 1
+            if max_chars is not None and length > max_chars:
+                break
+        return _cap_text("\n".join(paragraphs).strip(), max_chars)
     except Exception as e:
         st.error(f"Fehler beim Extrahieren des Textes aus der DOCX-Datei: {e}")
         return ""
 
+def image_to_jpeg(img, max_size):
+    """Converts a PIL image to RGB, shrinks it to max_size and returns JPEG bytes."""
+    # Convert to RGB if necessary
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    # Resize if the image is too large
+    if max(img.size) > max_size:
+        img = img.copy()
+        img.thumbnail((max_size, max_size))
+
+    # Save to bytes
+    img_byte_arr = io.BytesIO()
+    img.save(img_byte_arr, format='JPEG')
+    return img_byte_arr.getvalue()
+
+def open_image(_image):
+    """Opens an image given as base64 string, bytes, file-like object or PIL image."""
+    from PIL import Image
+    if isinstance(_image, (str, bytes)):
+        return Image.open(io.BytesIO(base64.b64decode(_image) if isinstance(_image, str) else _image))
+    if isinstance(_image, Image.Image):
+        return _image
+    return Image.open(_image)
+
 def process_image(_image):
     """Processes and resizes an image to reduce memory usage."""
     try:
-        if isinstance(_image, (str, bytes)):
-            img = Image.open(io.BytesIO(base64.b64decode(_image) if isinstance(_image, str) else _image))
-        elif isinstance(_image, Image.Image):
-            img = _image
-        else:
-            img = Image.open(_image)
-
-        # Convert to RGB if necessary
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-
-        # Resize if the image is too large
-        max_size = 1000
-        if max(img.size) > max_size:
-            img.thumbnail((max_size, max_size))
-
-        # Save to bytes
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='JPEG')
-        img_byte_arr = img_byte_arr.getvalue()
-
-        return base64.b64encode(img_byte_arr).decode('utf-8')
+        img_bytes = image_to_jpeg(open_image(_image), MAX_IMAGE_SIZE)
+        return base64.b64encode(img_bytes).decode('utf-8')
     except Exception as e:
         st.error(f"Fehler bei der Verarbeitung des Bildes: {e}")
         return ""
 
+def image_payload_chars(image):
+    """Returns the length of the base64 JPEG that process_image sends for an image."""
+    return 4 * math.ceil(len(image_to_jpeg(open_image(image), MAX_IMAGE_SIZE)) / 3)
+
+def pdf_page_payload_chars(data, page=1):
+    """Returns the base64 payload length of one PDF page as sent by process_image.
+
+    The page is rendered straight into the MAX_IMAGE_SIZE box instead of at full resolution.
+    """
+    from pdf2image import convert_from_bytes
+    try:
+        images = convert_from_bytes(data, first_page=page, last_page=page, size=MAX_IMAGE_SIZE)
+        return image_payload_chars(images[0]) if images else 0
+    except Exception as e:
+        st.error(f"Fehler beim Konvertieren der PDF in Bilder: {e}")
+        return 0
+
 def is_pdf_ocr(text):
     """Checks if the PDF contains OCR text."""
     return bool(text)
@@ -86,14 +149,14 @@ def clean_json_string(s):
     match = re.search(r'\[.*\]', s, re.DOTALL)
     return match.group(0) if match else s
 
-def process_pdf(file):
+def process_pdf(file, max_pages=None):
     """Processes a PDF file by extracting text or converting to images if OCR fails."""
     text_content = extract_text_from_pdf(file)
     
     # If no text found, assume it's not OCR and process as image
     if not text_content or not is_pdf_ocr(text_content):
         st.warning("Dieses PDF ist nicht OCR-geschützt. Textextraktion fehlgeschlagen. Bitte laden Sie ein OCR-PDF hoch.")
-        images = convert_pdf_to_images(file)
+        images = convert_pdf_to_images(file, max_pages)
         return None, images  # Fallback to image processing
     else:
         return text_content, None
@@ -0,0 +1,128 @@
+# utils/job_planner.py
+
+import math
+from .openai_client import SYSTEM_PROMPT, MAX_TOKENS
+from .prompt_registry import get_prompt
+
+# Local token heuristic: about 4 characters per token for prose
+CHARS_PER_TOKEN = 4
+
+# Images are sent inline as base64 JPEG text (at most 1000px), which tokenizes far worse than prose
+BASE64_CHARS_PER_TOKEN = 2.5
+
+# Fallback when the payload of an image could not be measured: a 1000px page JPEG of
+# about 110 KB gives about 150'000 base64 characters, i.e. 60'000 tokens at the rate above
+IMAGE_INPUT_TOKENS = 60000
+
+# Expected answer length; MAX_TOKENS is the hard upper bound per call
+EXPECTED_OUTPUT_TOKENS = 1000
+
+# USD per 1M tokens (input, output) and approximate input/output processing speed in tokens per second
+MODEL_PRICING = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+MODEL_OUTPUT_SPEED = {
+    "gpt-4o": 80,
+    "gpt-4o-mini": 120,
+}
+MODEL_INPUT_SPEED = {
+    "gpt-4o": 3000,
+    "gpt-4o-mini": 5000,
+}
+REQUEST_OVERHEAD_SECONDS = 1.5
+
+# Requests are sent one after another; no client-side rate limit is applied
+DEFAULT_CONCURRENCY = 1
+DEFAULT_REQUESTS_PER_MINUTE = None
+
+def estimate_tokens(text):
+    """Estimates the token count of a text without calling a tokenizer."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+def estimate_image_tokens(image_chars):
+    """Estimates the tokens of an inline base64 image from its payload length."""
+    if not image_chars:
+        return IMAGE_INPUT_TOKENS
+    return math.ceil(image_chars / BASE64_CHARS_PER_TOKEN)
+
+def estimate_input_tokens(msg_type, user_input, learning_goals, with_image=False, image_chars=0):
+    """Estimates the input tokens of one request as built by get_chatgpt_response."""
+    prompt = f"{get_prompt(msg_type) or ''}\n\nBenutzereingabe: {user_input}\n\nLernziele: {learning_goals}"
+    tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt)
+    if with_image:
+        tokens += estimate_image_tokens(image_chars)
+    return tokens
+
+def enumerate_work_units(files, selected_types, max_pages=None):
+    """Lists one work unit per API call: text files and images once per type, scanned PDFs once per page and type.
+
+    files is a list of dicts with 'name', 'kind' ('text', 'pages', 'image' or 'unsupported'), 'pages'
+    and 'image_chars', the measured base64 payload per page (0 if unknown).
+    """
+    units = []
+    for file in files:
+        if file["kind"] == "pages":
+            page_count = file["pages"] if not max_pages else min(file["pages"], max_pages)
+            pages = range(1, page_count + 1)
+        elif file["kind"] in ("text", "image"):
+            pages = [None]
+        else:
+            continue
+        for page in pages:
+            for msg_type in selected_types:
+                units.append({
+                    "file": file["name"],
+                    "page": page,
+                    "type": msg_type,
+                    "with_image": file["kind"] != "text",
+                    "image_chars": file.get("image_chars", 0),
+                })
+    return units
+
+def plan_job(files, selected_types, user_input, learning_goals, model, max_pages=None,
+             concurrency=DEFAULT_CONCURRENCY, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE):
+    """Projects calls, tokens, cost and wall-clock time of a generation job without calling the API.
+
+    Types whose template cannot be loaded are skipped, as generate_questions_for_content does.
+    """
+    skipped_types = [msg_type for msg_type in selected_types if get_prompt(msg_type) is None]
+    planned_types = [msg_type for msg_type in selected_types if msg_type not in skipped_types]
+    units = enumerate_work_units(files, planned_types, max_pages)
+    input_price, output_price = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4o"])
+    output_speed = MODEL_OUTPUT_SPEED.get(model, MODEL_OUTPUT_SPEED["gpt-4o"])
+    input_speed = MODEL_INPUT_SPEED.get(model, MODEL_INPUT_SPEED["gpt-4o"])
+
+    prompt_tokens = {}
+    for unit in units:
+        key = (unit["type"], unit["with_image"], unit["image_chars"])
+        if key not in prompt_tokens:
+            prompt_tokens[key] = estimate_input_tokens(unit["type"], user_input, learning_goals, unit["with_image"], unit["image_chars"])
+        unit["input_tokens"] = prompt_tokens[key]
+        unit["output_tokens"] = EXPECTED_OUTPUT_TOKENS
+        unit["seconds"] = (
+            REQUEST_OVERHEAD_SECONDS
+            + unit["input_tokens"] / input_speed
+            + unit["output_tokens"] / output_speed
+        )
+
+    calls = len(units)
+    input_tokens = sum(unit["input_tokens"] for unit in units)
+    output_tokens = sum(unit["output_tokens"] for unit in units)
+    cost = (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+    max_cost = (input_tokens * input_price + calls * MAX_TOKENS * output_price) / 1_000_000
+
+    seconds = sum(unit["seconds"] for unit in units) / max(concurrency, 1)
+    if requests_per_minute:
+        seconds = max(seconds, calls / requests_per_minute * 60)
+
+    return {
+        "units": units,
+        "calls": calls,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cost": cost,
+        "max_cost": max_cost,
+        "seconds": seconds,
+        "skipped_types": skipped_types,
+    }
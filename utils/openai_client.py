@@ -1,14 +1,43 @@
 # utils/openai_client.py
 
 import os
-import httpx
-from openai import OpenAI
 import streamlit as st
 import logging
 from .file_processing import process_image
 
+# Upper bound for the length of a generated answer
+MAX_TOKENS = 1500
+
+# Static system prompt, built once so every request shares the same cacheable prefix
+SYSTEM_PROMPT = (
+    """
+            Du bist ein Experte im Bildungsbereich, spezialisiert auf die Erstellung von Testfragen und -antworten zu allen Themen, unter Einhaltung der Bloom's Taxonomy. Deine Aufgabe ist es, hochwertige Frage-Antwort-Sets basierend auf dem vom Benutzer bereitgestellten Material zu erstellen, wobei jede Frage einer spezifischen Ebene der Bloom's Taxonomy entspricht: Erinnern, Verstehen, Anwenden, Analysieren, Bewerten und Erstellen.
+
+            Der Benutzer wird entweder Text oder ein Bild hochladen. Deine Aufgaben sind wie folgt:
+
+            **Input-Analyse:**
+
+            - Du analysierst den Inhalt sorgfältig, um die Schlüsselkonzepte und wichtigen Informationen zu verstehen.
+            - Falls vorhanden, achtest du auf Diagramme, Grafiken, Bilder oder Infografiken, um Bildungsinhalte abzuleiten.
+
+            **Fragen-Generierung nach Bloom-Ebene:**
+            Basierend auf dem analysierten Material generierst du Fragen über alle die folgenden Ebenen der Bloom's Taxonomy:
+
+            - **Erinnern**: Einfache, abrufbasierte Fragen.
+            - **Verstehen**: Fragen, die das Verständnis des Materials bewerten.
+            - **Anwenden**: Fragen, die die Anwendung des Wissens in praktischen Situationen erfordern.
+            - **Analysieren**: Fragen, die die Fähigkeit zur Analyse des Materials testen.
+            - **Bewerten**: Fragen, die die Bewertung von Informationen oder Ideen verlangen.
+            - **Erstellen**: Fragen, die die Erstellung neuer Inhalte oder Konzepte erfordern.
+    """
+)
+
 def initialize_openai_client(api_key):
     """Initializes the OpenAI client without proxy settings."""
+    # Imported here so the SDK is only loaded once an API key has been entered
+    import httpx
+    from openai import OpenAI
+
     try:
         os.environ.pop('HTTP_PROXY', None)
         os.environ.pop('HTTPS_PROXY', None)
@@ -38,34 +67,10 @@ def get_chatgpt_response(client, prompt, model, image=None, selected_language="G
         return None
 
     try:
-        # System prompt with language instructions
-        system_prompt = (
-            """
-            Du bist ein Experte im Bildungsbereich, spezialisiert auf die Erstellung von Testfragen und -antworten zu allen Themen, unter Einhaltung der Bloom's Taxonomy. Deine Aufgabe ist es, hochwertige Frage-Antwort-Sets basierend auf dem vom Benutzer bereitgestellten Material zu erstellen, wobei jede Frage einer spezifischen Ebene der Bloom's Taxonomy entspricht: Erinnern, Verstehen, Anwenden, Analysieren, Bewerten und Erstellen.
-
-            Der Benutzer wird entweder Text oder ein Bild hochladen. Deine Aufgaben sind wie folgt:
-
-            **Input-Analyse:**
-
-            - Du analysierst den Inhalt sorgfältig, um die Schlüsselkonzepte und wichtigen Informationen zu verstehen.
-            - Falls vorhanden, achtest du auf Diagramme, Grafiken, Bilder oder Infografiken, um Bildungsinhalte abzuleiten.
-
-            **Fragen-Generierung nach Bloom-Ebene:**
-            Basierend auf dem analysierten Material generierst du Fragen über alle die folgenden Ebenen der Bloom's Taxonomy:
-
-            - **Erinnern**: Einfache, abrufbasierte Fragen.
-            - **Verstehen**: Fragen, die das Verständnis des Materials bewerten.
-            - **Anwenden**: Fragen, die die Anwendung des Wissens in praktischen Situationen erfordern.
-            - **Analysieren**: Fragen, die die Fähigkeit zur Analyse des Materials testen.
-            - **Bewerten**: Fragen, die die Bewertung von Informationen oder Ideen verlangen.
-            - **Erstellen**: Fragen, die die Erstellung neuer Inhalte oder Konzepte erfordern.
-            """
-        )
-
         if image:
             base64_image = process_image(image)
             messages = [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {
                     "role": "user", 
                     "content": f"{prompt}\n\n[Image Data: data:image/jpeg;base64,{base64_image}]"
@@ -73,7 +78,7 @@ def get_chatgpt_response(client, prompt, model, image=None, selected_language="G
             ]
         else:
             messages = [
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
 
@@ -83,7 +88,7 @@ def get_chatgpt_response(client, prompt, model, image=None, selected_language="G
         response = client.chat.completions.create(
             model=model,
             messages=messages,
-            max_tokens=1500,  # Adjusted max tokens to a reasonable number
+            max_tokens=MAX_TOKENS,
             temperature=0.6
         )
         
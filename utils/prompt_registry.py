@@ -0,0 +1,101 @@
+# utils/prompt_registry.py
+
+import os
+import re
+import logging
+import streamlit as st
+
+PROMPTS_DIR = "prompts"
+
+# Placeholders such as {bloom_level}; free-text markers like {fill the blanks text 1} are not matched
+PLACEHOLDER_PATTERN = re.compile(r"\{([a-z_]+)\}")
+
+# Placeholders a template may contain; anything else is rejected as a likely typo
+KNOWN_PLACEHOLDERS = {"bloom_level"}
+
+# Default placeholder values per question type
+PROMPT_DEFAULTS = {
+    "draganddrop": {"bloom_level": "Verstehen"},
+}
+
+# name -> (mtime, segments); segments alternate literal text and placeholder names
+_registry = {}
+
+
+def _prompt_path(name):
+    return os.path.join(PROMPTS_DIR, f"{name}.md")
+
+
+def _compile_template(template):
+    """Splits a template into literal segments and placeholder names once, so rendering is a join."""
+    return PLACEHOLDER_PATTERN.split(template)
+
+
+def _load_prompt(name):
+    """Loads, validates and compiles a template, reusing the cached version while its mtime is unchanged."""
+    path = _prompt_path(name)
+    mtime = os.path.getmtime(path)
+    cached = _registry.get(name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as file:
+        template = file.read()
+    if not template.strip():
+        raise ValueError(f"Die Prompt-Datei '{name}.md' ist leer.")
+
+    segments = _compile_template(template)
+    unknown = sorted(set(segments[1::2]) - KNOWN_PLACEHOLDERS)
+    if unknown:
+        raise ValueError(f"Die Prompt-Datei '{name}.md' enthält unbekannte Platzhalter: {', '.join(unknown)}.")
+    _registry[name] = (mtime, segments)
+    logging.info(f"Prompt template '{name}' loaded")
+    return segments
+
+
+def preload_prompts(names):
+    """Loads and validates all given templates up front. Returns the names that failed."""
+    failed = []
+    for name in names:
+        try:
+            _load_prompt(name)
+        except (OSError, ValueError) as e:
+            logging.error(f"Prompt template '{name}' could not be loaded: {e}")
+            failed.append(name)
+    return failed
+
+
+def get_prompt(name, **values):
+    """Returns the filled template for a question type, or None if it cannot be loaded.
+
+    Placeholders without a value are left untouched so the model can fill them itself.
+    Unlike render_prompt, this reports nothing in the UI.
+    """
+    try:
+        segments = _load_prompt(name)
+    except (OSError, ValueError):
+        return None
+
+    values = {**PROMPT_DEFAULTS.get(name, {}), **values}
+    parts = []
+    for idx, segment in enumerate(segments):
+        if idx % 2 == 0:
+            parts.append(segment)
+        else:
+            parts.append(values.get(segment, f"{{{segment}}}"))
+    return "".join(parts)
+
+
+def render_prompt(name, **values):
+    """Returns the filled template for a question type, showing an error if it cannot be loaded."""
+    prompt = get_prompt(name, **values)
+    if prompt is not None:
+        return prompt
+
+    try:
+        _load_prompt(name)
+    except FileNotFoundError:
+        st.error(f"Die Prompt-Datei '{name}.md' wurde nicht gefunden.")
+    except (OSError, ValueError) as e:
+        st.error(str(e))
+    return ""
@@ -4,7 +4,8 @@ import json
 import re
 import random
 import streamlit as st
-from .helpers import replace_german_sharp_s, read_prompt_from_md
+from .helpers import replace_german_sharp_s
+from .prompt_registry import render_prompt
 from .file_processing import clean_json_string, convert_json_to_text_format
 from .openai_client import get_chatgpt_response
 
@@ -51,29 +52,11 @@ def generate_questions_for_content(text, user_input, learning_goals, selected_ty
     all_responses = ""
     generated_content = {}
     for msg_type in selected_types:
-        prompt_template = read_prompt_from_md(msg_type)
+        prompt_template = render_prompt(msg_type)
         if not prompt_template:
             continue  # Skip if no prompt file found
 
-        # Replace placeholders in the prompt_template
-        if msg_type == "draganddrop":
-            # Example: Replace {bloom_level} with actual level
-            # You need to define how to map msg_type to bloom_level
-            # For demonstration, let's assume you have a mapping
-            bloom_level_mapping = {
-                "draganddrop": "Verstehen",
-                "inline_fib": "Erinnern",
-                # Add other mappings as needed
-            }
-            bloom_level = bloom_level_mapping.get(msg_type, "Verstehen")
-            prompt_template = prompt_template.replace("{bloom_level}", bloom_level)
-            # Similarly, replace other placeholders if any
-        elif msg_type == "inline_fib":
-            # Handle specific replacements for inline_fib
-            pass
-        # Add more elif blocks for other msg_types if necessary
-
-        # Combine the prompt template with user input and learning goals
+        # Static template first, variable user input last, so the prompt prefix stays cacheable
         full_prompt = f"{prompt_template}\n\nBenutzereingabe: {user_input}\n\nLernziele: {learning_goals}"
         
         response = get_chatgpt_response(client, full_prompt, model=selected_model, image=image, selected_language=selected_language)
@@ -0,0 +1,110 @@
+# utils/warmup.py
+
+import argparse
+import ast
+import importlib
+import logging
+import subprocess
+import sys
+import threading
+import time
+
+# Heavy dependencies that are imported lazily at first use
+HEAVY_MODULES = (
+    "PyPDF2",
+    "docx",
+    "pdf2image",
+    "PIL.Image",
+    "httpx",
+    "openai",
+)
+
+# Packages of the app itself; the benchmark measures their modules as imported by app.py
+APP_PACKAGES = ("utils", "components")
+
+# Imported before the timer starts so measurements show only the app's own import cost
+BASELINE_MODULES = ("streamlit",)
+
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+
+def _preload_modules(modules):
+    for module in modules:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logging.warning(f"Warm-up import of '{module}' failed: {e}")
+            continue
+        logging.info(f"Warm-up imported '{module}' in {time.perf_counter() - start:.2f}s")
+
+def start_warmup(modules=HEAVY_MODULES):
+    """Preloads heavy modules in a background thread, once per server process.
+
+    Called after the first render so the imports do not delay the first paint.
+    """
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is not None:
+            return
+        _warmup_thread = threading.Thread(target=_preload_modules, args=(modules,), name="import-warmup", daemon=True)
+        _warmup_thread.start()
+
+def app_modules(app_path="app.py"):
+    """Returns the app's own modules that app.py imports at the top level, i.e. before the first paint."""
+    with open(app_path, "r", encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename=app_path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        for name in names:
+            if name.split(".")[0] in APP_PACKAGES and name not in modules:
+                modules.append(name)
+    return modules
+
+def measure_import_time(module, baseline=BASELINE_MODULES):
+    """Returns the import time of a module in seconds, measured in a fresh interpreter.
+
+    The baseline modules are imported before the timer starts.
+    """
+    code = (
+        "".join(f"import {name}; " for name in baseline)
+        + "import time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - start)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else module)
+    return float(result.stdout.strip())
+
+def run_startup_benchmark(max_seconds=None):
+    """Prints import times of the app modules (excluding Streamlit) and heavy dependencies.
+
+    Returns False if an app module exceeds max_seconds or fails to import.
+    """
+    ok = True
+    for group, modules in (("App-Module", app_modules()), ("Abhängigkeiten", HEAVY_MODULES)):
+        print(f"{group}:")
+        for module in modules:
+            try:
+                seconds = measure_import_time(module, BASELINE_MODULES if group == "App-Module" else ())
+            except ImportError as e:
+                print(f"  {module:<30} Fehler: {e}")
+                ok = ok and group != "App-Module"
+                continue
+            over_budget = group == "App-Module" and max_seconds is not None and seconds > max_seconds
+            print(f"  {module:<30} {seconds:.3f}s{'  > Budget' if over_budget else ''}")
+            ok = ok and not over_budget
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measures the import time of the app modules before the first paint.")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fails if an app module takes longer to import.")
+    args = parser.parse_args()
+    sys.exit(0 if run_startup_benchmark(args.max_seconds) else 1)